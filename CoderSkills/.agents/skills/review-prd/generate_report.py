@@ -1,18 +1,34 @@
 #!/usr/bin/env python3
-"""将审查结果 JSON 生成 Excel 报告。"""
+"""将审查结果 JSON 生成 Excel 报告。
+
+用法:
+  python generate_report.py <JSON文件路径> [输出Excel路径]
+  python generate_report.py <JSON文件路径> [输出Excel路径] --engine xlsxwriter   # 大批量数据时更快
+"""
+
+from __future__ import annotations
 
 import sys
 import json
+from collections import Counter, defaultdict
 from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
+# openpyxl 导入较慢，首次写 openpyxl 版报告时才导入（见 _ensure_openpyxl），
+# 参数错误提前退出或使用 xlsxwriter 引擎时都不必付出这部分开销
+Workbook = None
+
+# 可选加速：安装了 orjson 时用它解析输入 JSON
 try:
-    from openpyxl import Workbook
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.utils import get_column_letter
+    import orjson
 except ImportError:
-    print("需要安装 openpyxl: pip install openpyxl")
-    sys.exit(1)
+    def _load_json(path: Path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+else:
+    def _load_json(path: Path):
+        return orjson.loads(path.read_bytes())
 
 
 SEVERITY_COLORS = {
@@ -21,9 +37,9 @@ SEVERITY_COLORS = {
     "低": "4CAF50",
 }
 
-SEVERITY_ROW_FILLS = {
-    "高": PatternFill(start_color="FFF0F0", end_color="FFF0F0", fill_type="solid"),
-    "中": PatternFill(start_color="FFFBF0", end_color="FFFBF0", fill_type="solid"),
+SEVERITY_ROW_COLORS = {
+    "高": "FFF0F0",
+    "中": "FFFBF0",
 }
 
 TYPE_COLORS = {
@@ -33,191 +49,328 @@ TYPE_COLORS = {
     "异常处理覆盖": "F3E5F5",
 }
 
+HEADER_COLOR = "2196F3"
+HEADERS = ["序号", "所属模块", "问题类型", "严重程度", "问题描述", "文档来源", "修改建议", "产品回复", "状态"]
+COL_WIDTHS = [6, 15, 16, 10, 50, 25, 40, 30, 12]
+STATUS_OPTIONS = ["待确认", "已确认", "已修复", "不修改", "延期处理"]
+
+# 下拉选项列：(列字母, 选项, 出错提示, 出错标题)
+LIST_VALIDATIONS = [
+    ("I", STATUS_OPTIONS, "请选择有效的状态", "无效状态"),
+]
+
+# 汇总 sheet 中按单一维度统计的表：(标题, 首列名)
+SUMMARY_TABLES = [
+    ("按问题类型统计", "问题类型"),
+    ("按严重程度统计", "严重程度"),
+    ("按模块统计", "模块"),
+]
+CROSS_SEVERITIES = ["高", "中", "低"]
+
+ENGINES = ("openpyxl", "xlsxwriter")
+
+# openpyxl 版数据单元格使用的命名样式名
+DATA_CELL_STYLE = "data_cell"
+
+# xlsxwriter 格式属性，与 _ensure_openpyxl 中构建的 openpyxl 样式一一对应
+XW_CELL_FORMAT = {"font_name": "微软雅黑", "font_size": 10, "valign": "top", "text_wrap": True}
+XW_HEADER_FORMAT = {
+    "font_name": "微软雅黑", "font_size": 11, "bold": True, "font_color": "#FFFFFF",
+    "bg_color": "#" + HEADER_COLOR, "align": "center", "valign": "vcenter", "text_wrap": True,
+    "border": 1,
+}
+XW_SUMMARY_TITLE_FORMAT = {"font_name": "微软雅黑", "font_size": 11, "bold": True}
+XW_SUMMARY_HEADER_FORMAT = {**XW_SUMMARY_TITLE_FORMAT, "border": 1}
+XW_SUMMARY_CELL_FORMAT = {"font_name": "微软雅黑", "font_size": 10, "border": 1}
+
+
+def _ensure_openpyxl():
+    """导入 openpyxl 并构建写报告用的样式对象，只在首次调用时执行。"""
+    global Workbook, WriteOnlyCell, NamedStyle, FormulaRule, DataValidation, get_column_letter
+    global SEVERITY_FONTS, SEVERITY_ROW_FILLS, TYPE_FILLS, THIN_BORDER
+    global CELL_FONT, CELL_ALIGN, HEADER_CELL_STYLE
+    global SUMMARY_TITLE_STYLE, SUMMARY_HEADER_STYLE, SUMMARY_CELL_STYLE
+    if Workbook is not None:
+        return
+
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+        from openpyxl.formatting.rule import FormulaRule
+        from openpyxl.worksheet.datavalidation import DataValidation
+        from openpyxl.utils import get_column_letter
+    except ImportError:
+        print("需要安装 openpyxl: pip install openpyxl")
+        sys.exit(1)
 
-def generate_excel(issues: list[dict], output_path: str):
-    """生成 Excel 审查报告。"""
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "PRD审查报告"
-
-    headers = ["序号", "所属模块", "问题类型", "严重程度", "问题描述", "文档来源", "修改建议", "产品回复", "状态"]
-    col_widths = [6, 15, 16, 10, 50, 25, 40, 30, 12]
-
-    header_font = Font(name="微软雅黑", bold=True, size=11, color="FFFFFF")
-    header_fill = PatternFill(start_color="2196F3", end_color="2196F3", fill_type="solid")
-    header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    cell_font = Font(name="微软雅黑", size=10)
-    cell_align = Alignment(vertical="top", wrap_text=True)
-    thin_border = Border(
+    # 按颜色预构建的字体/填充，逐行复用同一实例
+    SEVERITY_FONTS = {
+        severity: Font(name="微软雅黑", size=10, bold=True, color=color)
+        for severity, color in SEVERITY_COLORS.items()
+    }
+
+    SEVERITY_ROW_FILLS = {
+        severity: PatternFill(start_color=color, end_color=color, fill_type="solid")
+        for severity, color in SEVERITY_ROW_COLORS.items()
+    }
+
+    TYPE_FILLS = {
+        issue_type: PatternFill(start_color=color, end_color=color, fill_type="solid")
+        for issue_type, color in TYPE_COLORS.items()
+    }
+
+    THIN_BORDER = Border(
         left=Side(style="thin"),
         right=Side(style="thin"),
         top=Side(style="thin"),
         bottom=Side(style="thin"),
     )
+    CELL_FONT = Font(name="微软雅黑", size=10)
+    CELL_ALIGN = Alignment(vertical="top", wrap_text=True)
+
+    # 预构建的单元格样式，每项为 (font, fill, alignment, border)，None 表示不设置
+    HEADER_CELL_STYLE = (
+        Font(name="微软雅黑", bold=True, size=11, color="FFFFFF"),
+        PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid"),
+        Alignment(horizontal="center", vertical="center", wrap_text=True),
+        THIN_BORDER,
+    )
 
-    # 写表头
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_align
-        cell.border = thin_border
-
-    # 设置列宽
-    for col_idx, width in enumerate(col_widths, 1):
+    SUMMARY_TITLE_STYLE = (Font(name="微软雅黑", bold=True, size=11), None, None, None)
+    SUMMARY_HEADER_STYLE = (Font(name="微软雅黑", bold=True, size=11), None, None, THIN_BORDER)
+    SUMMARY_CELL_STYLE = (CELL_FONT, None, None, THIN_BORDER)
+
+
+def _styled_cell(ws, value, style: "tuple | str") -> "WriteOnlyCell":
+    """按预构建样式创建 write-only 单元格，style 为样式元组或已注册的命名样式名。"""
+    cell = WriteOnlyCell(ws, value=value)
+    if isinstance(style, str):
+        cell.style = style
+        return cell
+    font, fill, alignment, border = style
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    if border is not None:
+        cell.border = border
+    return cell
+
+
+def generate_excel(issues: list[dict], output_path: str, engine: str = "openpyxl"):
+    """生成 Excel 审查报告。"""
+    writer = write_xlsxwriter if engine == "xlsxwriter" else write_openpyxl
+    # 汇总统计在后台线程中计算，与主表的写入同时进行
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        summaries = executor.submit(_summary_counts, issues)
+        writer(issues, output_path, summaries)
+
+    print(f"报告已生成: {output_path}")
+    print(f"共 {len(issues)} 个问题 (高:{sum(1 for i in issues if i.get('severity')=='高')}, "
+          f"中:{sum(1 for i in issues if i.get('severity')=='中')}, "
+          f"低:{sum(1 for i in issues if i.get('severity')=='低')})")
+
+
+def _row_values(issue: dict, index: int) -> list:
+    """返回一条问题在主表中由数据填充的各列值（产品回复、状态列除外）。"""
+    return [
+        issue.get("id", index),
+        issue.get("module", ""),
+        issue.get("type", ""),
+        issue.get("severity", ""),
+        issue.get("description", ""),
+        issue.get("source", ""),
+        issue.get("suggestion", ""),
+    ]
+
+
+def _list_validations(last_row: int) -> list[tuple[tuple[str, ...], str | None, str | None, str]]:
+    """按 LIST_VALIDATIONS 生成数据验证规则，选项和提示相同的列合并为一条。
+
+    返回 [(选项, 出错提示, 出错标题, 以空格分隔的区域)]。
+    """
+    ranges: dict[tuple, list[str]] = {}
+    for col, options, error, error_title in LIST_VALIDATIONS:
+        ranges.setdefault((tuple(options), error, error_title), []).append(f"{col}2:{col}{last_row}")
+    return [(*rule, " ".join(refs)) for rule, refs in ranges.items()]
+
+
+def write_openpyxl(issues: list[dict], output_path: str, summaries: Future):
+    """用 openpyxl 写出报告。
+
+    summaries 为后台计算 _summary_counts 的 Future，写汇总 sheet 前再取结果。
+    """
+    _ensure_openpyxl()
+    # write-only 模式逐行流式写出，避免在内存中保留整张表的单元格对象
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("PRD审查报告")
+    # 数据单元格统一套用命名样式，每个单元格只需一次样式赋值
+    wb.add_named_style(NamedStyle(
+        name=DATA_CELL_STYLE, font=CELL_FONT, alignment=CELL_ALIGN, border=THIN_BORDER,
+    ))
+
+    # 列宽和冻结窗格需在写入第一行之前设置
+    for col_idx, width in enumerate(COL_WIDTHS, 1):
         ws.column_dimensions[get_column_letter(col_idx)].width = width
+    ws.freeze_panes = "A2"
+    # 产品回复列整列设置字体和对齐，数据行不再逐个写样式单元格，
+    # 产品后续填写的内容也沿用该样式
+    reply_col = ws.column_dimensions[get_column_letter(8)]
+    reply_col.font = CELL_FONT
+    reply_col.alignment = CELL_ALIGN
 
-    # 写数据
-    for row_idx, issue in enumerate(issues, 2):
-        values = [
-            issue.get("id", row_idx - 1),
-            issue.get("module", ""),
-            issue.get("type", ""),
-            issue.get("severity", ""),
-            issue.get("description", ""),
-            issue.get("source", ""),
-            issue.get("suggestion", ""),
-            "",  # 产品回复（留空给产品填写）
-            "待确认",  # 状态默认值
-        ]
-
-        for col_idx, value in enumerate(values, 1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=value)
-            cell.font = cell_font
-            cell.alignment = cell_align
-            cell.border = thin_border
+    # 写表头
+    ws.append([_styled_cell(ws, header, HEADER_CELL_STYLE) for header in HEADERS])
 
-        severity = issue.get("severity", "")
+    # 写数据
+    for index, issue in enumerate(issues, 1):
+        cells = [_styled_cell(ws, value, DATA_CELL_STYLE) for value in _row_values(issue, index)]
+        cells.append(None)  # 产品回复列留空，不写单元格，样式由整列提供
+        cells.append(_styled_cell(ws, STATUS_OPTIONS[0], DATA_CELL_STYLE))  # 状态默认值
 
         # 严重程度文字着色
-        if severity in SEVERITY_COLORS:
-            ws.cell(row=row_idx, column=4).font = Font(
-                name="微软雅黑", size=10, bold=True, color=SEVERITY_COLORS[severity]
-            )
-
-        # 高/中严重度整行背景色
-        if severity in SEVERITY_ROW_FILLS:
-            for col_idx in range(1, len(headers) + 1):
-                # 不覆盖问题类型列的特殊背景色
-                if col_idx != 3:
-                    ws.cell(row=row_idx, column=col_idx).fill = SEVERITY_ROW_FILLS[severity]
-
-        # 问题类型背景色
-        issue_type = issue.get("type", "")
-        if issue_type in TYPE_COLORS:
-            fill = PatternFill(
-                start_color=TYPE_COLORS[issue_type],
-                end_color=TYPE_COLORS[issue_type],
-                fill_type="solid",
-            )
-            ws.cell(row=row_idx, column=3).fill = fill
-
-    # 状态列下拉选项（数据验证）
-    from openpyxl.worksheet.datavalidation import DataValidation
-    status_dv = DataValidation(
-        type="list",
-        formula1='"待确认,已确认,已修复,不修改,延期处理"',
-        allow_blank=True,
+        severity = issue.get("severity", "")
+        if severity in SEVERITY_FONTS:
+            cells[3].font = SEVERITY_FONTS[severity]
+
+        ws.append(cells)
+
+    # 背景色按列值走条件格式：每个取值一条规则覆盖整个数据区，
+    # 不再逐单元格写 fill，且排序/筛选后颜色仍跟随所在行
+    last_row = len(issues) + 1
+    # 产品回复列边框同样按区域设置
+    ws.conditional_formatting.add(
+        f"H2:H{last_row}",
+        FormulaRule(formula=["TRUE"], border=THIN_BORDER),
     )
-    status_dv.error = "请选择有效的状态"
-    status_dv.errorTitle = "无效状态"
-    status_col = get_column_letter(9)  # 状态列
-    status_dv.add(f"{status_col}2:{status_col}{len(issues) + 1}")
-    ws.add_data_validation(status_dv)
-
-    # 冻结首行 + 自动筛选
-    ws.freeze_panes = "A2"
-    ws.auto_filter.ref = f"A1:{get_column_letter(len(headers))}{len(issues) + 1}"
+    # 高/中严重度整行背景色（不覆盖问题类型列的特殊背景色）
+    for severity, fill in SEVERITY_ROW_FILLS.items():
+        ws.conditional_formatting.add(
+            f"A2:B{last_row} D2:I{last_row}",
+            FormulaRule(formula=[f'$D2="{severity}"'], fill=fill),
+        )
+    # 问题类型背景色
+    for issue_type, fill in TYPE_FILLS.items():
+        ws.conditional_formatting.add(
+            f"C2:C{last_row}",
+            FormulaRule(formula=[f'$C2="{issue_type}"'], fill=fill),
+        )
+
+    # 下拉选项（数据验证）：规则相同的列合并为一条，区域一次设好
+    for options, error, error_title, sqref in _list_validations(last_row):
+        ws.data_validations.append(DataValidation(
+            type="list",
+            formula1=f'"{",".join(options)}"',
+            allow_blank=True,
+            error=error,
+            errorTitle=error_title,
+            sqref=sqref,
+        ))
+
+    # 自动筛选
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(HEADERS))}{last_row}"
 
     # 添加汇总 sheet
-    _add_summary_sheet(wb, issues)
+    _add_summary_sheet(wb, *summaries.result())
 
     wb.save(output_path)
-    print(f"报告已生成: {output_path}")
-    print(f"共 {len(issues)} 个问题 (高:{sum(1 for i in issues if i.get('severity')=='高')}, "
-          f"中:{sum(1 for i in issues if i.get('severity')=='中')}, "
-          f"低:{sum(1 for i in issues if i.get('severity')=='低')})")
 
 
-def _add_summary_sheet(wb: Workbook, issues: list[dict]):
-    """添加汇总统计 sheet。"""
-    ws = wb.create_sheet("汇总统计")
-    header_font = Font(name="微软雅黑", bold=True, size=11)
-    cell_font = Font(name="微软雅黑", size=10)
-    thin_border = Border(
-        left=Side(style="thin"), right=Side(style="thin"),
-        top=Side(style="thin"), bottom=Side(style="thin"),
-    )
-
-    def write_table(start_row: int, title: str, col1_name: str, data: dict) -> int:
-        ws.cell(row=start_row, column=1, value=title).font = header_font
-        row = start_row + 1
-        ws.cell(row=row, column=1, value=col1_name).font = header_font
-        ws.cell(row=row, column=1).border = thin_border
-        ws.cell(row=row, column=2, value="数量").font = header_font
-        ws.cell(row=row, column=2).border = thin_border
-        row += 1
-        for key, count in data.items():
-            ws.cell(row=row, column=1, value=key).font = cell_font
-            ws.cell(row=row, column=1).border = thin_border
-            ws.cell(row=row, column=2, value=count).font = cell_font
-            ws.cell(row=row, column=2).border = thin_border
-            row += 1
-        return row + 1
-
-    # 按问题类型统计
-    type_counts = {}
-    for issue in issues:
-        t = issue.get("type", "未分类")
-        type_counts[t] = type_counts.get(t, 0) + 1
-    next_row = write_table(1, "按问题类型统计", "问题类型", type_counts)
-
-    # 按严重程度统计
-    sev_counts = {}
-    for issue in issues:
-        s = issue.get("severity", "未分类")
-        sev_counts[s] = sev_counts.get(s, 0) + 1
-    next_row = write_table(next_row, "按严重程度统计", "严重程度", sev_counts)
-
-    # 按模块统计
-    mod_counts = {}
-    for issue in issues:
-        m = issue.get("module", "未分类")
-        mod_counts[m] = mod_counts.get(m, 0) + 1
-    next_row = write_table(next_row, "按模块统计", "模块", mod_counts)
+def write_xlsxwriter(issues: list[dict], output_path: str, summaries: Future):
+    """用 xlsxwriter 的 constant_memory 模式写出报告，大批量数据时更快、更省内存。
 
-    # 按模块×严重程度交叉统计
-    ws.cell(row=next_row, column=1, value="按模块×严重程度统计").font = header_font
-    row = next_row + 1
-    severities = ["高", "中", "低"]
-    ws.cell(row=row, column=1, value="模块").font = header_font
-    ws.cell(row=row, column=1).border = thin_border
-    for i, s in enumerate(severities, 2):
-        ws.cell(row=row, column=i, value=s).font = header_font
-        ws.cell(row=row, column=i).border = thin_border
-    ws.cell(row=row, column=len(severities) + 2, value="合计").font = header_font
-    ws.cell(row=row, column=len(severities) + 2).border = thin_border
-    row += 1
-
-    cross: dict[str, dict[str, int]] = {}
-    for issue in issues:
-        m = issue.get("module", "未分类")
-        s = issue.get("severity", "未分类")
-        cross.setdefault(m, {}).setdefault(s, 0)
-        cross[m][s] = cross[m].get(s, 0) + 1
+    版式与 write_openpyxl 一致；constant_memory 模式下必须按行顺序写入。
+    summaries 为后台计算 _summary_counts 的 Future，写汇总 sheet 前再取结果。
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        print("需要安装 xlsxwriter: pip install xlsxwriter")
+        sys.exit(1)
 
-    for mod, sev_map in cross.items():
-        ws.cell(row=row, column=1, value=mod).font = cell_font
-        ws.cell(row=row, column=1).border = thin_border
-        total = 0
-        for i, s in enumerate(severities, 2):
-            count = sev_map.get(s, 0)
-            ws.cell(row=row, column=i, value=count).font = cell_font
-            ws.cell(row=row, column=i).border = thin_border
-            total += count
-        ws.cell(row=row, column=len(severities) + 2, value=total).font = cell_font
-        ws.cell(row=row, column=len(severities) + 2).border = thin_border
-        row += 1
+    # 关闭 strings_to_urls：与 openpyxl 版一样按原文写入，像 URL 的文本不转成超链接，
+    # 超过 Excel 超链接长度上限的 URL 也不会被丢弃
+    wb = xlsxwriter.Workbook(output_path, {"constant_memory": True, "strings_to_urls": False})
+    ws = wb.add_worksheet("PRD审查报告")
+
+    # 格式对象只创建一次，逐行复用
+    header_fmt = wb.add_format(XW_HEADER_FORMAT)
+    cell_fmt = wb.add_format({**XW_CELL_FORMAT, "border": 1})
+    reply_fmt = wb.add_format(XW_CELL_FORMAT)
+    severity_fmts = {
+        severity: wb.add_format({**XW_CELL_FORMAT, "border": 1, "bold": True, "font_color": "#" + color})
+        for severity, color in SEVERITY_COLORS.items()
+    }
+
+    for col_idx, width in enumerate(COL_WIDTHS):
+        ws.set_column(col_idx, col_idx, width, reply_fmt if col_idx == 7 else None)
+    ws.freeze_panes(1, 0)
+
+    ws.write_row(0, 0, HEADERS, header_fmt)
+    for index, issue in enumerate(issues, 1):
+        ws.write_row(index, 0, _row_values(issue, index), cell_fmt)
+        severity = issue.get("severity", "")
+        if severity in severity_fmts:
+            ws.write(index, 3, severity, severity_fmts[severity])
+        # 产品回复列留空，样式由整列提供
+        ws.write(index, 8, STATUS_OPTIONS[0], cell_fmt)
+
+    last_row = len(issues) + 1
+    ws.conditional_format(f"H2:H{last_row}", {
+        "type": "formula", "criteria": "TRUE", "format": wb.add_format({"border": 1}),
+    })
+    for severity, color in SEVERITY_ROW_COLORS.items():
+        ws.conditional_format(f"A2:B{last_row}", {
+            "type": "formula",
+            "criteria": f'$D2="{severity}"',
+            "format": wb.add_format({"bg_color": "#" + color}),
+            "multi_range": f"A2:B{last_row} D2:I{last_row}",
+        })
+    for issue_type, color in TYPE_COLORS.items():
+        ws.conditional_format(f"C2:C{last_row}", {
+            "type": "formula",
+            "criteria": f'$C2="{issue_type}"',
+            "format": wb.add_format({"bg_color": "#" + color}),
+        })
+
+    # 与 openpyxl 版本一致：提供下拉选项，但不拦截其他输入
+    for options, error, error_title, sqref in _list_validations(last_row):
+        validation = {
+            "validate": "list",
+            "source": list(options),
+            "show_error": False,
+            "multi_range": sqref,
+        }
+        if error:
+            validation["error_message"] = error
+            validation["error_title"] = error_title
+        ws.data_validation(sqref.split()[0], validation)
+    ws.autofilter(0, 0, last_row - 1, len(HEADERS) - 1)
+
+    _add_summary_sheet_xlsxwriter(wb, *summaries.result())
+    wb.close()
+
+
+def _summary_counts(issues: list[dict]) -> tuple[list[Counter], dict[str, Counter]]:
+    """统计汇总 sheet 所需数据。
+
+    返回 (与 SUMMARY_TABLES 对应的各维度计数, 模块 -> 严重程度计数)。
+    """
+    types = [issue.get("type", "未分类") for issue in issues]
+    sevs = [issue.get("severity", "未分类") for issue in issues]
+    mods = [issue.get("module", "未分类") for issue in issues]
+    cross: dict[str, Counter] = defaultdict(Counter)
+    for (m, s), count in Counter(zip(mods, sevs)).items():
+        cross[m][s] = count
+    return [Counter(types), Counter(sevs), Counter(mods)], cross
+
+
+def _add_summary_sheet(wb: "Workbook", tables: list[Counter], cross: dict[str, Counter]):
+    """按 _summary_counts 的统计结果添加汇总统计 sheet。"""
+    ws = wb.create_sheet("汇总统计")
 
     ws.column_dimensions["A"].width = 22
     ws.column_dimensions["B"].width = 10
@@ -225,27 +378,91 @@ def _add_summary_sheet(wb: Workbook, issues: list[dict]):
     ws.column_dimensions["D"].width = 10
     ws.column_dimensions["E"].width = 10
 
+    def write_table(title: str, col1_name: str, data: dict):
+        ws.append([_styled_cell(ws, title, SUMMARY_TITLE_STYLE)])
+        ws.append([
+            _styled_cell(ws, col1_name, SUMMARY_HEADER_STYLE),
+            _styled_cell(ws, "数量", SUMMARY_HEADER_STYLE),
+        ])
+        for key, count in data.items():
+            ws.append([
+                _styled_cell(ws, key, SUMMARY_CELL_STYLE),
+                _styled_cell(ws, count, SUMMARY_CELL_STYLE),
+            ])
+        ws.append([])
+
+    for (title, col1_name), data in zip(SUMMARY_TABLES, tables):
+        write_table(title, col1_name, data)
+
+    # 按模块×严重程度交叉统计
+    ws.append([_styled_cell(ws, "按模块×严重程度统计", SUMMARY_TITLE_STYLE)])
+    ws.append([
+        _styled_cell(ws, value, SUMMARY_HEADER_STYLE)
+        for value in ["模块", *CROSS_SEVERITIES, "合计"]
+    ])
+
+    for mod, sev_map in cross.items():
+        counts = [sev_map[s] for s in CROSS_SEVERITIES]
+        ws.append([
+            _styled_cell(ws, value, SUMMARY_CELL_STYLE)
+            for value in [mod, *counts, sum(counts)]
+        ])
+
+
+def _add_summary_sheet_xlsxwriter(wb, tables: list[Counter], cross: dict[str, Counter]):
+    """按 _summary_counts 的统计结果添加汇总统计 sheet（xlsxwriter 版）。"""
+    ws = wb.add_worksheet("汇总统计")
+    ws.set_column(0, 0, 22)
+    ws.set_column(1, 4, 10)
+
+    title_fmt = wb.add_format(XW_SUMMARY_TITLE_FORMAT)
+    header_fmt = wb.add_format(XW_SUMMARY_HEADER_FORMAT)
+    cell_fmt = wb.add_format(XW_SUMMARY_CELL_FORMAT)
+
+    row = 0
+    for (title, col1_name), data in zip(SUMMARY_TABLES, tables):
+        ws.write(row, 0, title, title_fmt)
+        ws.write_row(row + 1, 0, [col1_name, "数量"], header_fmt)
+        row += 2
+        for key, count in data.items():
+            ws.write_row(row, 0, [key, count], cell_fmt)
+            row += 1
+        row += 1  # 表之间空一行
+
+    ws.write(row, 0, "按模块×严重程度统计", title_fmt)
+    ws.write_row(row + 1, 0, ["模块", *CROSS_SEVERITIES, "合计"], header_fmt)
+    row += 2
+    for mod, sev_map in cross.items():
+        counts = [sev_map[s] for s in CROSS_SEVERITIES]
+        ws.write_row(row, 0, [mod, *counts, sum(counts)], cell_fmt)
+        row += 1
+
 
 def main():
-    if len(sys.argv) < 2:
-        print("用法: python generate_report.py <JSON文件路径> [输出Excel路径]")
+    args = sys.argv[1:]
+    engine = "openpyxl"
+    if "--engine" in args:
+        i = args.index("--engine")
+        engine = args[i + 1] if i + 1 < len(args) else ""
+        del args[i:i + 2]
+    if not args or engine not in ENGINES:
+        print("用法: python generate_report.py <JSON文件路径> [输出Excel路径] [--engine openpyxl|xlsxwriter]")
         sys.exit(1)
 
-    json_path = Path(sys.argv[1])
+    json_path = Path(args[0])
     if not json_path.exists():
         print(f"JSON 文件不存在: {json_path}")
         sys.exit(1)
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        issues = json.load(f)
+    issues = _load_json(json_path)
 
-    if len(sys.argv) >= 3:
-        output_path = sys.argv[2]
+    if len(args) >= 2:
+        output_path = args[1]
     else:
         date_str = datetime.now().strftime("%Y%m%d")
         output_path = str(json_path.parent / f"PRD审查报告_{date_str}.xlsx")
 
-    generate_excel(issues, output_path)
+    generate_excel(issues, output_path, engine)
 
 
 if __name__ == "__main__":
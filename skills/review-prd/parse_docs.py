@@ -6,37 +6,126 @@
   python parse_docs.py <文档目录路径> --latest    # 只解析每组文档的最新版本
 """
 
+from __future__ import annotations
+
 import sys
+import io
 import os
+import posixpath
 import re
+import zipfile
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-try:
-    from docx import Document
-except ImportError:
-    print("需要安装 python-docx: pip install python-docx")
-    sys.exit(1)
-
-try:
-    from openpyxl import load_workbook
-except ImportError:
-    print("需要安装 openpyxl: pip install openpyxl")
-    sys.exit(1)
+# lxml、openpyxl 在首次解析文档时才导入（见 _ensure_lxml / _ensure_openpyxl），
+# 参数错误提前退出时不必付出导入开销
+etree = None
+BUILTIN_FORMATS = None
 
 
 # 匹配文件名中的日期版本号，如 "PRD文档（1203）" 或 "字段规则（1122）" 或 "字段规则1014"
 VERSION_PATTERN = re.compile(r"[（(]?(\d{4})[）)]?(?=\.\w+$|$)")
 
+# 待解析文件的扩展名
+DOC_SUFFIXES = (".docx", ".xlsx")
+
+# docx 内部 XML 的命名空间标签（Clark 格式）
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_BODY = W_NS + "body"
+W_P = W_NS + "p"
+W_TBL = W_NS + "tbl"
+W_TR = W_NS + "tr"
+W_TC = W_NS + "tc"
+W_R = W_NS + "r"
+W_T = W_NS + "t"
+W_BR = W_NS + "br"
+W_HYPERLINK = W_NS + "hyperlink"
+W_P_STYLE = f"{W_NS}pPr/{W_NS}pStyle"
+W_GRID_BEFORE = f"{W_NS}trPr/{W_NS}gridBefore"
+W_GRID_SPAN = f"{W_NS}tcPr/{W_NS}gridSpan"
+W_V_MERGE = f"{W_NS}tcPr/{W_NS}vMerge"
+W_STYLE = W_NS + "style"
+W_NAME = W_NS + "name"
+W_VAL = W_NS + "val"
+W_TYPE = W_NS + "type"
+W_STYLE_ID = W_NS + "styleId"
+W_DEFAULT = W_NS + "default"
+
+# xlsx 内部 XML 的命名空间标签（Clark 格式）
+X_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+X_SHEET = X_NS + "sheet"
+X_SHEETS = X_NS + "sheets"
+X_WORKBOOK_PR = X_NS + "workbookPr"
+X_DIMENSION = X_NS + "dimension"
+X_ROW = X_NS + "row"
+X_C = X_NS + "c"
+X_V = X_NS + "v"
+X_IS = X_NS + "is"
+X_SI = X_NS + "si"
+X_T = X_NS + "t"
+X_R = X_NS + "r"
+X_NUM_FMTS = X_NS + "numFmts"
+X_CELL_XFS = X_NS + "cellXfs"
+R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# run 中除 w:t / w:br 以外需要转成文本的元素
+RUN_SPECIAL_TEXT = {
+    W_NS + "tab": "\t",
+    W_NS + "ptab": "\t",
+    W_NS + "cr": "\n",
+    W_NS + "noBreakHyphen": "-",
+}
+
+# styles.xml 中内置标题样式名为小写（"heading 1"），界面上显示为 "Heading 1"
+HEADING_STYLE_ALIASES = {f"heading {i}": f"Heading {i}" for i in range(1, 10)}
+
+# 文档来自外部，解析 XML 时不展开实体；由 _ensure_lxml 创建
+XML_PARSER = None
+
+
+def _ensure_lxml():
+    """导入 lxml 并创建 XML 解析器，只在首次调用时执行。"""
+    global etree, XML_PARSER
+    if etree is not None:
+        return
+
+    try:
+        from lxml import etree
+    except ImportError:
+        print("需要安装 lxml: pip install lxml")
+        sys.exit(1)
+    XML_PARSER = etree.XMLParser(resolve_entities=False)
+
+
+def _ensure_openpyxl():
+    """导入解析 xlsx 用到的 openpyxl 工具函数，只在首次调用时执行。"""
+    global BUILTIN_FORMATS, is_date_format, is_timedelta_format
+    global coordinate_to_tuple, range_boundaries
+    global MAC_EPOCH, WINDOWS_EPOCH, from_excel, from_ISO8601
+    if BUILTIN_FORMATS is not None:
+        return
+
+    try:
+        from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+        from openpyxl.utils.cell import coordinate_to_tuple, range_boundaries
+        from openpyxl.utils.datetime import MAC_EPOCH, WINDOWS_EPOCH, from_excel, from_ISO8601
+    except ImportError:
+        print("需要安装 openpyxl: pip install openpyxl")
+        sys.exit(1)
+
 
+@lru_cache(maxsize=None)
 def extract_version_key(filename: str) -> tuple[str, str]:
     """从文件名提取基础名和版本号。
 
     返回 (base_name, version)，如果没有版本号则 version 为空字符串。
     例如: "样本中心需求PRD文档（1203）.docx" -> ("样本中心需求PRD文档.docx", "1203")
+    结果按文件名缓存，同一批文件名重复调用时不再重新匹配。
     """
-    stem = Path(filename).stem
-    suffix = Path(filename).suffix
+    stem, suffix = os.path.splitext(filename)
 
     match = VERSION_PATTERN.search(stem)
     if match:
@@ -70,85 +159,431 @@ def filter_latest_versions(filepaths: list[Path]) -> list[Path]:
     return sorted(result)
 
 
+def collect_doc_files(doc_dir: Path) -> list[Path]:
+    """递归收集目录下待解析的文件，跳过 _parsed 输出目录和隐藏文件。
+
+    用 os.scandir 逐层遍历并先按扩展名过滤；每层按名称排序后深度优先展开，
+    结果顺序与对全部路径排序一致。与 rglob 相同，不进入指向目录的符号链接，
+    避免链接成环时无限递归、链接到同级目录时重复解析。
+    """
+    files = []
+
+    def walk(path: str):
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: os.path.normcase(entry.name))
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "_parsed":
+                    walk(entry.path)
+            elif (entry.is_file() and not entry.name.startswith(".")
+                  and os.path.splitext(entry.name)[1].lower() in DOC_SUFFIXES):
+                files.append(Path(entry.path))
+
+    walk(str(doc_dir))
+    return files
+
+
+def _part_path(base_dir: str, target: str) -> str:
+    """把关系表中的 Target 解析为 zip 包内路径。"""
+    return posixpath.normpath(posixpath.join("/" + base_dir, target)).lstrip("/")
+
+
+def _load_rels(zf: zipfile.ZipFile, part_path: str) -> list[tuple[str, str, str]]:
+    """读取部件自己的关系表，返回 [(关系 id, 关系类型, 目标包内路径)]。
+
+    关系类型取类型 URI 的最后一段，如 "officeDocument"、"styles"；
+    part_path 为空字符串时读取包关系表 _rels/.rels。外部链接不在包内，直接跳过。
+    """
+    base_dir, name = posixpath.split(part_path)
+    try:
+        data = zf.read(posixpath.join(base_dir, "_rels", name + ".rels"))
+    except KeyError:
+        return []
+
+    rels = []
+    for rel in etree.fromstring(data, XML_PARSER).iterchildren(PKG_REL_NS + "Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        rel_type = rel.get("Type", "").rsplit("/", 1)[-1]
+        rels.append((rel.get("Id"), rel_type, _part_path(base_dir, rel.get("Target", ""))))
+    return rels
+
+
+def _main_part_path(zf: zipfile.ZipFile) -> str:
+    """按包关系表找到主文档部件（docx 的 document.xml、xlsx 的 workbook.xml）的包内路径。"""
+    for _, rel_type, path in _load_rels(zf, ""):
+        if rel_type == "officeDocument":
+            return path
+    raise ValueError("文档缺少 officeDocument 关系，无法定位主文档部件")
+
+
 def parse_docx(filepath: Path) -> str:
-    """解析 docx 文件，提取所有文本内容（含表格）。"""
-    doc = Document(str(filepath))
-    parts = []
+    """解析 docx 文件，提取所有文本内容（含表格）。
 
-    for element in doc.element.body:
-        tag = element.tag.split("}")[-1]
-
-        if tag == "p":
-            for para in doc.paragraphs:
-                if para._element is element:
-                    style = para.style.name if para.style else ""
-                    prefix = ""
-                    if "Heading" in style:
-                        level = style.replace("Heading", "").strip()
-                        prefix = "#" * int(level) + " " if level.isdigit() else "## "
-                    text = para.text.strip()
+    按包关系表定位主文档部件后直接流式解析，不构建完整的文档对象模型。
+    """
+    _ensure_lxml()
+    parts = []
+    with zipfile.ZipFile(filepath) as zf:
+        document_path = _main_part_path(zf)
+        document_rels = _load_rels(zf, document_path)
+        styles, default_style = _load_paragraph_styles(zf, document_rels)
+        with zf.open(document_path) as f:
+            for _, element in etree.iterparse(f, tag=(W_P, W_TBL), resolve_entities=False):
+                body = element.getparent()
+                # 只处理 body 下的顶层段落和表格，表格内的段落随表格一起处理
+                if body is None or body.tag != W_BODY:
+                    continue
+
+                if element.tag == W_P:
+                    style_el = element.find(W_P_STYLE)
+                    style = default_style
+                    if style_el is not None:
+                        style = styles.get(style_el.get(W_VAL), default_style)
+                    text = _paragraph_text(element).strip()
                     if text:
-                        parts.append(prefix + text)
-                    break
+                        parts.append(_heading_prefix(style) + text)
+
+                else:
+                    parts.append(_parse_table(element))
 
-        elif tag == "tbl":
-            for table in doc.tables:
-                if table._element is element:
-                    parts.append(_parse_table(table))
-                    break
+                # 处理完即释放已解析的节点，内存占用不随文档长度增长
+                element.clear()
+                while element.getprevious() is not None:
+                    del body[0]
 
     return "\n\n".join(parts)
 
 
-def _parse_table(table) -> str:
-    """将 docx 表格转为 markdown 格式。"""
-    rows = []
-    for row in table.rows:
-        cells = [cell.text.strip().replace("\n", " ") for cell in row.cells]
-        rows.append("| " + " | ".join(cells) + " |")
-    if len(rows) >= 1:
-        col_count = len(table.rows[0].cells)
-        separator = "| " + " | ".join(["---"] * col_count) + " |"
-        rows.insert(1, separator)
-    return "\n".join(rows)
+def _load_paragraph_styles(zf: zipfile.ZipFile,
+                           document_rels: list[tuple[str, str, str]]) -> tuple[dict[str, str], str]:
+    """读取主文档关联的样式部件，返回 (段落样式 id -> 样式名, 默认段落样式名)。"""
+    styles: dict[str, str] = {}
+    default_style = ""
+    styles_path = next((path for _, rel_type, path in document_rels if rel_type == "styles"), None)
+    if styles_path is None:
+        return styles, default_style
+    try:
+        data = zf.read(styles_path)
+    except KeyError:
+        return styles, default_style
+
+    root = etree.fromstring(data, XML_PARSER)
+    for style in root.iterchildren(W_STYLE):
+        if style.get(W_TYPE, "paragraph") != "paragraph":
+            continue
+        name_el = style.find(W_NAME)
+        name = name_el.get(W_VAL, "") if name_el is not None else ""
+        name = HEADING_STYLE_ALIASES.get(name, name)
+        styles[style.get(W_STYLE_ID)] = name
+        if style.get(W_DEFAULT) in ("1", "true", "on"):
+            default_style = name
+    return styles, default_style
+
+
+def _run_text(run) -> str:
+    """提取 w:r 的文本，制表符、换行等特殊元素转为对应字符。"""
+    texts = []
+    for child in run:
+        if child.tag == W_T:
+            texts.append(child.text or "")
+        elif child.tag == W_BR:
+            # 分页符、分栏符不产生文本
+            if child.get(W_TYPE, "textWrapping") == "textWrapping":
+                texts.append("\n")
+        elif child.tag in RUN_SPECIAL_TEXT:
+            texts.append(RUN_SPECIAL_TEXT[child.tag])
+    return "".join(texts)
+
+
+def _paragraph_text(para) -> str:
+    """提取 w:p 的文本（含超链接内的 run）。"""
+    texts = []
+    for child in para:
+        if child.tag == W_R:
+            texts.append(_run_text(child))
+        elif child.tag == W_HYPERLINK:
+            texts.extend(_run_text(run) for run in child.iterchildren(W_R))
+    return "".join(texts)
+
+
+def _heading_prefix(style: str) -> str:
+    """根据段落样式名返回 markdown 标题前缀。"""
+    if "Heading" not in style:
+        return ""
+    level = style.replace("Heading", "").strip()
+    return "#" * int(level) + " " if level.isdigit() else "## "
+
+
+def _parse_table(tbl) -> str:
+    """将 docx 表格（w:tbl 元素）转为 markdown 格式。
+
+    横向合并的单元格按跨列数重复，纵向合并的后续单元格沿用起始单元格的内容。
+    """
+    buf = io.StringIO()
+    has_rows = False
+    above: dict[int, str] = {}  # 上一行：起始网格列 -> 单元格文本
+
+    for tr in tbl.iterchildren(W_TR):
+        grid_before = tr.find(W_GRID_BEFORE)
+        offset = int(grid_before.get(W_VAL, 0)) if grid_before is not None else 0
+        cells = []
+        current: dict[int, str] = {}
+
+        for tc in tr.iterchildren(W_TC):
+            grid_span = tc.find(W_GRID_SPAN)
+            span = int(grid_span.get(W_VAL, 1)) if grid_span is not None else 1
+            v_merge = tc.find(W_V_MERGE)
+            if v_merge is not None and v_merge.get(W_VAL, "continue") == "continue":
+                text = above.get(offset, "")
+            else:
+                text = "\n".join(_paragraph_text(p) for p in tc.iterchildren(W_P))
+                text = text.strip().replace("\n", " ")
+            current[offset] = text
+            cells.extend([text] * span)
+            offset += span
+
+        # 各行直接写入同一个缓冲区，表头行之后紧跟分隔行
+        if has_rows:
+            buf.write("\n")
+        _write_row(buf, cells)
+        if not has_rows:
+            buf.write("\n")
+            _write_row(buf, ["---"] * len(cells))
+            has_rows = True
+        above = current
+
+    return buf.getvalue()
+
+
+def _write_row(buf: io.StringIO, cells) -> None:
+    """向缓冲区写入一行 markdown 表格（不含换行符）。"""
+    buf.write("| ")
+    buf.write(" | ".join(cells))
+    buf.write(" |")
 
 
 def parse_xlsx(filepath: Path) -> str:
-    """解析 xlsx 文件，提取所有 sheet 的内容。"""
-    wb = load_workbook(str(filepath), read_only=True, data_only=True)
-    parts = []
-
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        parts.append(f"## Sheet: {sheet_name}")
+    """解析 xlsx 文件，提取所有 sheet 的内容。
 
-        rows = []
-        for row in ws.iter_rows(values_only=True):
-            cells = [str(c) if c is not None else "" for c in row]
-            if any(cells):
-                rows.append("| " + " | ".join(cells) + " |")
+    直接流式解析各 sheet 的 XML，共享字符串表只读取一次，不为单元格构建对象。
+    """
+    _ensure_lxml()
+    _ensure_openpyxl()
+    buf = io.StringIO()
+    with zipfile.ZipFile(filepath) as zf:
+        sheets, part_paths, date1904 = _load_workbook_parts(zf)
+        shared_strings = _load_shared_strings(zf, part_paths.get("sharedStrings"))
+        date_styles, timedelta_styles = _load_date_styles(zf, part_paths.get("styles"))
+        epoch = MAC_EPOCH if date1904 else WINDOWS_EPOCH
+
+        for sheet_name, sheet_path in sheets:
+            if buf.tell():
+                buf.write("\n\n")
+            buf.write(f"## Sheet: {sheet_name}")
+
+            # 按 dimension 声明的已用区域确定列数，分隔行每个 sheet 只构造一次；
+            # 若缺少 dimension 信息，退回按首行宽度计算
+            ncols = max_row = None
+            separator = None
+            has_rows = False
+            row_idx = 0
+            with zf.open(sheet_path) as f:
+                for _, element in etree.iterparse(f, tag=(X_DIMENSION, X_ROW),
+                                                  resolve_entities=False):
+                    if element.tag == X_DIMENSION:
+                        _, _, ncols, max_row = range_boundaries(element.get("ref"))
+                        if ncols:
+                            separator = ["---"] * ncols
+                        continue
+
+                    row_idx = int(float(element.get("r", row_idx + 1)))
+                    if max_row is not None and row_idx > max_row:
+                        break
+
+                    values = _row_values(element, ncols, shared_strings,
+                                         date_styles, timedelta_styles, epoch)
+                    cells = [str(c) if c is not None else "" for c in values]
+                    if any(cells):
+                        # 各行直接写入整个文件共用的缓冲区，不再逐行拼接字符串
+                        buf.write("\n" if has_rows else "\n\n")
+                        _write_row(buf, cells)
+                        if not has_rows:
+                            buf.write("\n")
+                            _write_row(buf, separator or ["---"] * len(cells))
+                            has_rows = True
+
+                    # 处理完即释放已解析的行，内存占用不随 sheet 行数增长
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+
+    return buf.getvalue()
+
+
+def _load_workbook_parts(zf: zipfile.ZipFile) -> tuple[list[tuple[str, str]], dict[str, str], bool]:
+    """读取 workbook 部件及其关系表，workbook 部件的位置由包关系表确定。
+
+    返回 ([(sheet 名, 包内路径)], {部件类型: 包内路径}, 是否使用 1904 日期系统)，
+    部件类型取关系类型 URI 的最后一段，如 "sharedStrings"、"styles"。
+    只收录普通工作表，图表 sheet 等没有单元格数据的 sheet 会被跳过。
+    """
+    workbook_path = _main_part_path(zf)
+    targets = {}
+    part_paths = {}
+    for rel_id, rel_type, path in _load_rels(zf, workbook_path):
+        targets[rel_id] = (rel_type, path)
+        part_paths.setdefault(rel_type, path)
+
+    workbook = etree.fromstring(zf.read(workbook_path), XML_PARSER)
+    workbook_pr = workbook.find(X_WORKBOOK_PR)
+    date1904 = workbook_pr is not None and workbook_pr.get("date1904") in ("1", "true")
+
+    sheets = []
+    for sheet in workbook.find(X_SHEETS).iterchildren(X_SHEET):
+        rel_type, path = targets.get(sheet.get(R_ID), (None, None))
+        if rel_type == "worksheet":
+            sheets.append((sheet.get("name"), path))
+    return sheets, part_paths, date1904
+
+
+def _plain_text(element) -> str:
+    """拼接 si / is 元素中的纯文本（含富文本 run，忽略拼音注音）。"""
+    texts = []
+    t = element.find(X_T)
+    if t is not None and t.text:
+        texts.append(t.text)
+    for run in element.iterchildren(X_R):
+        t = run.find(X_T)
+        if t is not None and t.text:
+            texts.append(t.text)
+    return "".join(texts)
+
+
+def _load_shared_strings(zf: zipfile.ZipFile, path: str | None) -> list[str]:
+    """读取共享字符串表。"""
+    strings = []
+    if path is None:
+        return strings
+    with zf.open(path) as f:
+        for _, si in etree.iterparse(f, tag=X_SI, resolve_entities=False):
+            strings.append(_plain_text(si).replace("x005F_", ""))
+            si.clear()
+            while si.getprevious() is not None:
+                del si.getparent()[0]
+    return strings
+
+
+def _load_date_styles(zf: zipfile.ZipFile, path: str | None) -> tuple[set[int], set[int]]:
+    """读取 styles.xml，返回 (日期格式的单元格样式索引, 时长格式的单元格样式索引)。"""
+    date_styles: set[int] = set()
+    timedelta_styles: set[int] = set()
+    if path is None:
+        return date_styles, timedelta_styles
+
+    root = etree.fromstring(zf.read(path), XML_PARSER)
+    custom_formats = {}
+    num_fmts = root.find(X_NUM_FMTS)
+    if num_fmts is not None:
+        for num_fmt in num_fmts:
+            custom_formats[int(num_fmt.get("numFmtId"))] = num_fmt.get("formatCode")
+
+    cell_xfs = root.find(X_CELL_XFS)
+    if cell_xfs is None:
+        return date_styles, timedelta_styles
+    for idx, xf in enumerate(cell_xfs):
+        num_fmt_id = int(xf.get("numFmtId", 0))
+        fmt = custom_formats.get(num_fmt_id, BUILTIN_FORMATS.get(num_fmt_id))
+        if is_date_format(fmt):
+            date_styles.add(idx)
+        if is_timedelta_format(fmt):
+            timedelta_styles.add(idx)
+    return date_styles, timedelta_styles
+
+
+def _cell_value(cell, shared_strings: list[str], date_styles: set[int],
+                timedelta_styles: set[int], epoch):
+    """把 c 元素转为 Python 值（与 openpyxl data_only 模式读到的值一致）。"""
+    data_type = cell.get("t", "n")
+    if data_type == "inlineStr":
+        inline = cell.find(X_IS)
+        return _plain_text(inline) if inline is not None else None
+
+    value = cell.findtext(X_V) or None
+    if value is None:
+        return None
+    if data_type == "n":
+        value = float(value) if "." in value or "E" in value or "e" in value else int(value)
+        style_id = int(cell.get("s", 0))
+        if style_id in date_styles:
+            try:
+                return from_excel(value, epoch, timedelta=style_id in timedelta_styles)
+            except (OverflowError, ValueError):
+                return "#VALUE!"
+        return value
+    if data_type == "s":
+        return shared_strings[int(value)]
+    if data_type == "b":
+        return bool(int(value))
+    if data_type == "d":
+        return from_ISO8601(value)
+    return value
+
+
+def _row_values(row, max_col: int | None, shared_strings: list[str],
+                date_styles: set[int], timedelta_styles: set[int], epoch) -> list:
+    """按列位置展开一行单元格的值，空缺的列补 None。
+
+    max_col 为 None 时，行宽取该行最后一个单元格所在的列。
+    """
+    values = {}
+    col = 0
+    for cell in row.iterchildren(X_C):
+        ref = cell.get("r")
+        col = coordinate_to_tuple(ref)[1] if ref else col + 1
+        values[col] = _cell_value(cell, shared_strings, date_styles, timedelta_styles, epoch)
 
-        if rows:
-            col_count = rows[0].count("|") - 1
-            separator = "| " + " | ".join(["---"] * col_count) + " |"
-            rows.insert(1, separator)
-            parts.append("\n".join(rows))
+    width = max_col or (col if values else 0)
+    return [values.get(c) for c in range(1, width + 1)]
 
-    wb.close()
-    return "\n\n".join(parts)
 
+def make_unique_path(output_dir: Path, name: str, suffix: str,
+                     used_names: set[str]) -> Path:
+    """生成不冲突的输出文件路径，并把选中的文件名登记到 used_names。
 
-def make_unique_path(output_dir: Path, name: str, suffix: str) -> Path:
-    """生成不冲突的输出文件路径。"""
-    base_path = output_dir / f"{name}_{suffix}.txt"
-    if not base_path.exists():
-        return base_path
+    used_names 需预先包含 output_dir 中已有的文件名，查重全程在内存中完成。
+    文件名按 _name_key 忽略大小写比较：Windows、macOS 的文件系统不区分大小写，
+    "Spec_docx.txt" 与 "spec_docx.txt" 会落到同一个文件。
+    """
+    filename = f"{name}_{suffix}.txt"
     counter = 2
-    while True:
-        candidate = output_dir / f"{name}_{suffix}_{counter}.txt"
-        if not candidate.exists():
-            return candidate
+    while _name_key(filename) in used_names:
+        filename = f"{name}_{suffix}_{counter}.txt"
         counter += 1
+    used_names.add(_name_key(filename))
+    return output_dir / filename
+
+
+def _name_key(filename: str) -> str:
+    """返回 used_names 中登记文件名用的查重键。"""
+    return os.path.normcase(filename).casefold()
+
+
+def _parse_file(filepath: Path, suffix_tag: str, output_path: Path) -> str | None:
+    """解析单个文件并写出文本结果，在进程池的工作进程中执行。
+
+    成功返回 None，失败返回错误信息。lxml 的解析异常无法 pickle 传回主进程，
+    所以在工作进程内捕获，只把错误文本交给主进程输出。
+    """
+    try:
+        if suffix_tag == "docx":
+            content = parse_docx(filepath)
+        else:
+            content = parse_xlsx(filepath)
+        output_path.write_text(content, encoding="utf-8")
+    except Exception as e:
+        return str(e)
+    return None
 
 
 def main():
@@ -167,41 +602,51 @@ def main():
     output_dir.mkdir(exist_ok=True)
 
     # 收集所有待处理文件
-    all_files = []
-    for filepath in sorted(doc_dir.rglob("*")):
-        if "_parsed" in filepath.parts or filepath.name.startswith("."):
-            continue
-        if filepath.suffix.lower() in (".docx", ".xlsx"):
-            all_files.append(filepath)
+    all_files = collect_doc_files(doc_dir)
 
     # 多版本去重
     if latest_only:
         all_files = filter_latest_versions(all_files)
         print(f"[INFO] --latest 模式：筛选后 {len(all_files)} 个文件待解析\n")
 
-    parsed_files = []
-    used_names: set[str] = set()
+    # 先串行分配输出文件名，保证并行解析时各文件的输出路径互不冲突；
+    # 已有文件名只扫描一次输出目录，之后的查重不再逐个 stat
+    used_names = {_name_key(entry.name) for entry in os.scandir(output_dir)}
 
+    # 扩展名、相对路径等每个文件只计算一次，后续各处直接复用
+    tasks = []
     for filepath in all_files:
         suffix_tag = filepath.suffix[1:].lower()
-        output_path = make_unique_path(output_dir, filepath.stem, suffix_tag)
-        relative = filepath.relative_to(doc_dir)
-
-        try:
-            if suffix_tag == "docx":
-                content = parse_docx(filepath)
-                output_path.write_text(content, encoding="utf-8")
-                parsed_files.append(str(output_path))
-                print(f"[OK] {relative} -> {output_path.name}")
-
-            elif suffix_tag == "xlsx":
-                content = parse_xlsx(filepath)
-                output_path.write_text(content, encoding="utf-8")
-                parsed_files.append(str(output_path))
-                print(f"[OK] {relative} -> {output_path.name}")
-
-        except Exception as e:
-            print(f"[ERR] {relative}: {e}")
+        output_path = make_unique_path(output_dir, filepath.stem, suffix_tag, used_names)
+        tasks.append((filepath, filepath.relative_to(doc_dir), suffix_tag, output_path))
+
+    # 各文件相互独立，用进程池并行解析
+    parsed_files = []
+    if tasks:
+        # 先在主进程导入依赖，缺少依赖时直接提示退出，不必等每个工作进程各自报错。
+        # 只有 fork 启动的工作进程会继承已导入的模块；Windows、macOS 默认用 spawn，
+        # 工作进程仍会各自重新导入 lxml / openpyxl
+        _ensure_lxml()
+        if any(suffix_tag == "xlsx" for _, _, suffix_tag, _ in tasks):
+            _ensure_openpyxl()
+        max_workers = min(len(tasks), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_parse_file, filepath, suffix_tag, output_path)
+                for filepath, _, suffix_tag, output_path in tasks
+            ]
+            # 按提交顺序汇总结果，输出顺序与文件顺序一致
+            for (_, relative, _, output_path), future in zip(tasks, futures):
+                try:
+                    error = future.result()
+                except Exception as e:
+                    # 工作进程异常退出等进程池自身的错误
+                    error = str(e)
+                if error is None:
+                    parsed_files.append(str(output_path))
+                    print(f"[OK] {relative} -> {output_path.name}")
+                else:
+                    print(f"[ERR] {relative}: {error}")
 
     print(f"\n解析完成，共处理 {len(parsed_files)} 个文件，输出到 {output_dir}")
 